@@ -1,8 +1,10 @@
 # src/taskdantic/models.py
 from __future__ import annotations
 
+import weakref
 from datetime import datetime, timezone
-from typing import Any, ClassVar
+from itertools import islice
+from typing import Any, ClassVar, Iterable
 from uuid import UUID, uuid4
 
 from pydantic import (
@@ -13,16 +15,28 @@ from pydantic import (
     field_serializer,
     field_validator,
     model_validator,
+    ValidationError,
     ValidationInfo,
 )
+from pydantic_core import from_json, to_json
 
 from taskdantic.enums import Priority, Status
 from taskdantic.task_types import TWDatetime, UUIDList
 
+_UTC = timezone.utc
+
+# Task subclasses in definition order; populated by Task.__pydantic_init_subclass__.
+_TASK_SUBCLASSES: list[weakref.ref[type[Task]]] = []
+
 
 def _utc_now() -> datetime:
     """Return current UTC time."""
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
+
+
+def registered_task_subclasses() -> list[type[Task]]:
+    """Return live Task subclasses in definition order."""
+    return [sub for ref in _TASK_SUBCLASSES if (sub := ref()) is not None]
 
 
 def parse_depends_flexible(value: str | None) -> list[str]:
@@ -97,6 +111,12 @@ class Task(BaseModel):
     )
     CORE_FIELDS: ClassVar[set[str]] = set(CORE_FIELD_ORDER)
 
+    # Declared (non-core) UDA field names in sorted order; set per subclass.
+    UDA_FIELD_ORDER: ClassVar[tuple[str, ...]] = ()
+
+    # Pydantic computed fields excluded from Taskwarrior export; set per class.
+    _EXPORT_EXCLUDE: ClassVar[set[str]] = set()
+
     COMPUTED_FIELDS: ClassVar[set[str]] = {
         "id",
         "urgency",
@@ -123,6 +143,18 @@ class Task(BaseModel):
     annotations: list[Annotation] = Field(default_factory=list)
     depends: UUIDList = Field(default_factory=list)
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Register every Task subclass and precompute its UDA field order."""
+        super().__pydantic_init_subclass__(**kwargs)
+        core = cls.core_field_names()
+        cls.UDA_FIELD_ORDER = tuple(
+            sorted(name for name in cls.model_fields if name not in core and not name.startswith("_"))
+        )
+        cls._EXPORT_EXCLUDE = set(cls.model_computed_fields)
+        # The callback drops the entry as soon as the class is collected.
+        _TASK_SUBCLASSES.append(weakref.ref(cls, _TASK_SUBCLASSES.remove))
+
     @field_serializer("uuid")
     def serialize_uuid(self, value: UUID) -> str:
         """Serialize UUID to string for Taskwarrior."""
@@ -229,13 +261,16 @@ class Task(BaseModel):
         UUIDList serialized to comma-separated strings, etc.), consistent with
         `to_taskwarrior()`. :contentReference[oaicite:2]{index=2}
         """
-        data = self.to_taskwarrior(exclude_none=exclude_none)
-        core = self.__class__.core_field_names()
+        return self._select_udas(self.to_taskwarrior(exclude_none=exclude_none))
 
+    @classmethod
+    def _select_udas(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the UDA entries of an already-serialized Taskwarrior dict."""
+        core = cls.core_field_names()
         return {
             k: v
             for k, v in data.items()
-            if k not in core and k not in self.__class__.COMPUTED_FIELDS and not k.startswith("_")
+            if k not in core and k not in cls.COMPUTED_FIELDS and not k.startswith("_")
         }
 
     @property
@@ -255,11 +290,19 @@ class Task(BaseModel):
         Returns:
             Dictionary in Taskwarrior JSON format
         """
-        data = self.model_dump(
+        return self._dump_taskwarrior(exclude_none=exclude_none)
+
+    def _dump_taskwarrior(self, *, exclude_none: bool, exclude: set[str] | None = None) -> dict[str, Any]:
+        """Serialize to Taskwarrior JSON values, optionally skipping extra fields."""
+        cls = self.__class__
+        excluded = cls._EXPORT_EXCLUDE | exclude if exclude else cls._EXPORT_EXCLUDE
+        # Call the compiled serializer directly; model_dump only forwards to it.
+        data = cls.__pydantic_serializer__.to_python(
+            self,
             mode="json",
             exclude_none=exclude_none,
             by_alias=False,
-            exclude=set(self.__class__.model_computed_fields.keys()),
+            exclude=excluded,
         )
 
         # Additional cleanup: remove None values that came from serialization
@@ -269,6 +312,21 @@ class Task(BaseModel):
 
         return data
 
+    def to_taskwarrior_json(self, exclude_none: bool = True) -> str:
+        """
+        Export task as Taskwarrior JSON text, ready for `task import`.
+
+        Encodes the `to_taskwarrior()` dict with pydantic-core's JSON encoder
+        rather than the stdlib `json` module.
+
+        Args:
+            exclude_none: Whether to exclude None values from output
+
+        Returns:
+            JSON object string in Taskwarrior format
+        """
+        return to_json(self.to_taskwarrior(exclude_none=exclude_none)).decode()
+
     def normalized_for_prompt(self, *, max_annotations: int = 5) -> dict[str, Any]:
         """
         Return a prompt-stable representation of task data.
@@ -276,19 +334,28 @@ class Task(BaseModel):
         Ensures a stable core-field ordering, truncates annotations, and appends
         UDAs in sorted key order using Taskwarrior serialization.
         """
-        data = self.to_taskwarrior(exclude_none=True)
+        truncate = max_annotations >= 0
+        # Annotations are dumped separately so only the kept ones get serialized.
+        data = self._dump_taskwarrior(exclude_none=True, exclude={"annotations"} if truncate else None)
         normalized: dict[str, Any] = {}
 
         for key in self.__class__.CORE_FIELD_ORDER:
+            if key == "annotations" and truncate:
+                # Annotation's serializer, not each instance's, so subclasses dump like the export does.
+                dump_annotation = Annotation.__pydantic_serializer__.to_python
+                normalized[key] = [dump_annotation(a, mode="json") for a in islice(self.annotations, max_annotations)]
+                continue
             if key not in data:
                 continue
-            value = data[key]
-            if key == "annotations" and isinstance(value, list) and max_annotations >= 0:
-                value = value[:max_annotations]
-            normalized[key] = value
-
-        uda_data = self.model_dump_udas(exclude_none=True)
-        for key in sorted(uda_data.keys()):
+            normalized[key] = data[key]
+
+        # Reuse the export above instead of serializing the task a second time.
+        uda_data = self._select_udas(data)
+        uda_order = [key for key in self.__class__.UDA_FIELD_ORDER if key in uda_data]
+        if len(uda_order) != len(uda_data):
+            # Extra (undeclared) UDAs are per-instance, so fall back to a full sort.
+            uda_order = sorted(uda_data)
+        for key in uda_order:
             normalized[key] = uda_data[key]
 
         return normalized
@@ -303,7 +370,7 @@ class Task(BaseModel):
         Returns:
             JSON string representation
         """
-        return self.model_dump_json(exclude=set(self.model_computed_fields.keys()), **kwargs)
+        return self.model_dump_json(exclude=type(self)._EXPORT_EXCLUDE, **kwargs)
 
     @classmethod
     def from_json(cls, json_str: str) -> Task:
@@ -344,3 +411,91 @@ class Task(BaseModel):
         """
         clean_data = {k: v for k, v in data.items() if k not in cls.COMPUTED_FIELDS}
         return cls.model_validate(clean_data)
+
+    @classmethod
+    def try_from_taskwarrior(cls, data: dict[str, Any]) -> Task | ValidationError:
+        """
+        Parse task from Taskwarrior export JSON, returning the error instead of raising.
+
+        Intended for bulk imports where invalid rows are expected and skipped:
+        the ValidationError is returned untouched, so callers that never inspect
+        it do not pay for formatting `str(error)` or building `error.errors()`.
+
+        Args:
+            data: Raw task dictionary from Taskwarrior export
+
+        Returns:
+            Validated Task instance, or the ValidationError raised while validating
+        """
+        try:
+            return cls.from_taskwarrior(data)
+        except ValidationError as exc:
+            return exc
+
+    @classmethod
+    def from_taskwarrior_json(cls, raw: str | bytes) -> Task:
+        """
+        Parse a single task from Taskwarrior export JSON text.
+
+        The JSON is decoded by pydantic-core's parser (jiter) instead of the
+        stdlib `json` module, then filtered like `from_taskwarrior()`.
+
+        Args:
+            raw: JSON object text (str or bytes) for one task
+
+        Returns:
+            Validated Task instance
+
+        Raises:
+            ValueError: If the JSON is malformed or is not an object
+            ValidationError: If required fields are missing or invalid
+        """
+        data = from_json(raw)
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected a JSON object for one task, got {type(data).__name__}")
+        return cls.from_taskwarrior(data)
+
+    @classmethod
+    def from_taskwarrior_many(cls, rows: Iterable[dict[str, Any]]) -> list[Task]:
+        """
+        Parse multiple tasks from Taskwarrior export rows as this class.
+
+        Args:
+            rows: Raw task dictionaries from Taskwarrior export
+
+        Returns:
+            List of validated instances of `cls`
+
+        Raises:
+            ValueError: If a row is not a dictionary
+            ValidationError: If any task has missing or invalid fields
+        """
+        tasks = []
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                raise ValueError(f"Expected a task object at index {index}, got {type(row).__name__}")
+            tasks.append(cls.from_taskwarrior(row))
+        return tasks
+
+    @classmethod
+    def from_taskwarrior_json_many(cls, raw: str | bytes) -> list[Task]:
+        """
+        Parse a full `task export` JSON array in one decoding pass.
+
+        Args:
+            raw: JSON array text (str or bytes) as produced by `task export`
+
+        Returns:
+            List of validated instances of `cls`
+
+        Raises:
+            ValueError: If the JSON is malformed, is not an array, or holds a non-object
+            ValidationError: If any task has missing or invalid fields
+        """
+        rows = from_json(raw)
+        if not isinstance(rows, list):
+            raise ValueError(f"Expected a JSON array of tasks, got {type(rows).__name__}")
+        return cls.from_taskwarrior_many(rows)
+
+
+Task._EXPORT_EXCLUDE = set(Task.model_computed_fields)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Callable
 from uuid import UUID
 
 from taskdantic.enums import Status
@@ -11,6 +12,15 @@ from taskdantic.models import Annotation, Task, _utc_now
 class TaskService:
     """Service layer for task operations."""
 
+    def __init__(self, clock: Callable[[], datetime] = _utc_now) -> None:
+        """
+        Create a task service.
+
+        Args:
+            clock: Callable returning the current timezone-aware time (defaults to UTC now)
+        """
+        self._clock = clock
+
     def complete(self, task: Task) -> Task:
         """Mark task as completed."""
         if task.status == Status.DELETED:
@@ -18,7 +28,7 @@ class TaskService:
         if task.status == Status.COMPLETED:
             raise ValueError("Task is already completed")
 
-        now = _utc_now()
+        now = self._clock()
         task.status = Status.COMPLETED
         task.end = now
         task.modified = now
@@ -31,7 +41,7 @@ class TaskService:
         if task.start is not None:
             raise ValueError("Task is already started")
 
-        now = _utc_now()
+        now = self._clock()
         task.start = now
         task.modified = now
         return task
@@ -42,7 +52,7 @@ class TaskService:
             raise ValueError("Task is not started")
 
         task.start = None
-        task.modified = _utc_now()
+        task.modified = self._clock()
         return task
 
     def delete(self, task: Task) -> Task:
@@ -50,7 +60,7 @@ class TaskService:
         if task.status == Status.DELETED:
             raise ValueError("Task is already deleted")
 
-        now = _utc_now()
+        now = self._clock()
         task.status = Status.DELETED
         task.end = now
         task.modified = now
@@ -63,7 +73,7 @@ class TaskService:
             raise ValueError("Task cannot depend on itself")
         if uuid_to_add not in task.depends:
             task.depends.append(uuid_to_add)
-            task.modified = _utc_now()
+            task.modified = self._clock()
         return task
 
     def remove_dependency(self, task: Task, dependency: Task | UUID) -> Task:
@@ -71,29 +81,30 @@ class TaskService:
         uuid_to_remove = dependency.uuid if isinstance(dependency, Task) else dependency
         if uuid_to_remove in task.depends:
             task.depends.remove(uuid_to_remove)
-            task.modified = _utc_now()
+            task.modified = self._clock()
         return task
 
     def annotate(self, task: Task, description: str, entry: datetime | None = None) -> Annotation:
         """Add an annotation to the task."""
+        now = self._clock()
         annotation = Annotation(
-            entry=entry if entry is not None else _utc_now(),
+            entry=entry if entry is not None else now,
             description=description,
         )
         task.annotations.append(annotation)
-        task.modified = _utc_now()
+        task.modified = now
         return annotation
 
     def tag(self, task: Task, tag: str) -> Task:
         """Add a tag to the task."""
         if tag not in task.tags:
             task.tags.append(tag)
-            task.modified = _utc_now()
+            task.modified = self._clock()
         return task
 
     def untag(self, task: Task, tag: str) -> Task:
         """Remove a tag from the task."""
         if tag in task.tags:
             task.tags.remove(tag)
-            task.modified = _utc_now()
+            task.modified = self._clock()
         return task
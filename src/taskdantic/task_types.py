@@ -25,6 +25,7 @@ def _parse_tw_duration(value: str | int | timedelta) -> timedelta:
         return value
 
     if isinstance(value, str):
+        value = value.strip()
         if not value.startswith("PT"):
             raise ValueError(
                 f"Invalid ISO 8601 duration format: {value!r}. "
@@ -39,43 +40,49 @@ def _parse_tw_duration(value: str | int | timedelta) -> timedelta:
 
 
 def _parse_iso_duration(value: str) -> timedelta:
-    """Parse ISO 8601 duration string (PT#H#M#S)."""
-    hours = 0
-    minutes = 0
-    seconds = 0
+    """Parse ISO 8601 duration string (PT#H#M#S) in a single left-to-right pass."""
+    total = 0
+    pos = 2  # Skip PT prefix
 
-    remainder = value[2:]  # Remove PT prefix
+    end = value.find("H", pos)
+    if end != -1:
+        total = int(value[pos:end]) * 3600
+        pos = end + 1
 
-    if "H" in remainder:
-        hours_str, remainder = remainder.split("H", 1)
-        hours = int(hours_str)
+    end = value.find("M", pos)
+    if end != -1:
+        total += int(value[pos:end]) * 60
+        pos = end + 1
 
-    if "M" in remainder:
-        minutes_str, remainder = remainder.split("M", 1)
-        minutes = int(minutes_str)
+    end = value.find("S", pos)
+    if end != -1:
+        total += int(value[pos:end])
+        pos = end + 1
 
-    if "S" in remainder:
-        seconds = int(remainder.replace("S", ""))
+    if pos != len(value):
+        raise ValueError(
+            f"Invalid ISO 8601 duration format: {value!r}. "
+            f"Expected format: PT#H#M#S (e.g., 'PT2H30M')"
+        )
 
-    return timedelta(hours=hours, minutes=minutes, seconds=seconds)
+    return timedelta(seconds=total)
 
 
 def _serialize_tw_duration(value: timedelta) -> str:
     """Serialize timedelta to ISO 8601 duration string."""
-    total_seconds = int(value.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    total_seconds = value.days * 86400 + value.seconds
+    hours, rest = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
 
-    parts = []
+    parts = "PT"
     if hours:
-        parts.append(f"{hours}H")
+        parts += f"{hours}H"
     if minutes:
-        parts.append(f"{minutes}M")
+        parts += f"{minutes}M"
     if seconds:
-        parts.append(f"{seconds}S")
+        parts += f"{seconds}S"
 
-    return "PT" + "".join(parts) if parts else "PT0S"
+    return parts if len(parts) > 2 else "PT0S"
 
 
 def _parse_uuid_list(value: None | str | list[UUID | str]) -> list[UUID]:
@@ -89,7 +96,7 @@ def _parse_uuid_list(value: None | str | list[UUID | str]) -> list[UUID]:
     if isinstance(value, str):
         if not value.strip():
             return []
-        return [UUID(u.strip()) for u in value.split(",") if u.strip()]
+        return [UUID(token) for token in map(str.strip, value.split(",")) if token]
 
     raise ValueError(f"Expected None, str, or list, got {type(value).__name__}")
 
@@ -98,7 +105,7 @@ def _serialize_uuid_list(value: list[UUID]) -> str | None:
     """Serialize UUID list to comma-separated string."""
     if not value:
         return None
-    return ",".join(str(u) for u in value)
+    return ",".join(map(str, value))
 
 
 # Public type aliases using Annotated
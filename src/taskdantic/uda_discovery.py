@@ -4,31 +4,28 @@ import hashlib
 import importlib.util
 import sys
 from pathlib import Path
-from typing import Iterable
 
-from taskdantic.models import Task
+from taskdantic.models import Task, registered_task_subclasses
 
-
-def _iter_all_subclasses(cls: type) -> Iterable[type]:
-    seen: set[type] = set()
-    stack = list(cls.__subclasses__())
-    while stack:
-        sub = stack.pop()
-        if sub in seen:
-            continue
-        seen.add(sub)
-        yield sub
-        stack.extend(sub.__subclasses__())
+# module name -> sha1 of the source bytes when it was last executed. Content, not
+# mtime, so edits inside a coarse timestamp window (FAT, some mounts) are seen.
+_LOADED_DIGESTS: dict[str, bytes] = {}
 
 
 def _import_module_from_path(path: Path) -> str | None:
     """
     Import a python file by absolute path as an anonymous module.
+
+    Files that are unchanged since their last import are not re-executed.
     """
     # stable-ish unique module name to avoid collisions
     digest = hashlib.sha1(str(path).encode("utf-8")).hexdigest()[:12]
     mod_name = f"taskdantic_autoload_{digest}"
 
+    source_digest = hashlib.sha1(path.read_bytes()).digest()
+    if _LOADED_DIGESTS.get(mod_name) == source_digest and mod_name in sys.modules:
+        return mod_name
+
     spec = importlib.util.spec_from_file_location(mod_name, str(path))
     if spec is None or spec.loader is None:
         return None
@@ -36,6 +33,7 @@ def _import_module_from_path(path: Path) -> str | None:
     module = importlib.util.module_from_spec(spec)
     sys.modules[mod_name] = module
     spec.loader.exec_module(module)  # type: ignore[union-attr]
+    _LOADED_DIGESTS[mod_name] = source_digest
     return mod_name
 
 
@@ -65,9 +63,8 @@ def import_task_modules_from_dir(root_dir: str | Path) -> set[str]:
 def discover_task_models(allowed_modules: set[str] | None = None) -> list[type[Task]]:
     """
     Discover Task subclasses currently registered in this process.
+
+    Subclasses register themselves when their class body executes, so this is
+    a filter over the registry (in definition order) rather than a hierarchy walk.
     """
-    models: list[type[Task]] = []
-    for sub in _iter_all_subclasses(Task):
-        if isinstance(sub, type) and (allowed_modules is None or sub.__module__ in allowed_modules):
-            models.append(sub)  # type: ignore[assignment]
-    return models
+    return [sub for sub in registered_task_subclasses() if allowed_modules is None or sub.__module__ in allowed_modules]
@@ -1,20 +1,22 @@
 from __future__ import annotations
 
+import re
+
 BEGIN_MARKER = "# BEGIN TASKDANTIC UDAS"
 END_MARKER = "# END TASKDANTIC UDAS"
 
+# Every boundary str.splitlines() recognises (\r\n is covered by \r and \n).
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+# A line break, whatever str.strip() would remove, then the name between "uda."
+# and the first ".type=" on that line. Comment lines never start with "uda.".
+_UDA_TYPE_LINE_RE = re.compile(rf"[{_LINE_BREAKS}]\s*uda\.([^{_LINE_BREAKS}]*?)\.type=")
+
 
 def parse_existing_uda_names(taskrc_text: str) -> set[str]:
-    names: set[str] = set()
-    for raw in taskrc_text.splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if line.startswith("uda.") and ".type=" in line:
-            rest = line[len("uda.") :]
-            name = rest.split(".type=", 1)[0].strip()
-            if name:
-                names.add(name)
+    # Prefix a newline so the first line is matched like every other line.
+    names = {match.group(1).strip() for match in _UDA_TYPE_LINE_RE.finditer("\n" + taskrc_text)}
+    names.discard("")
     return names
 
 
@@ -24,8 +26,8 @@ def upsert_uda_block(taskrc_text: str, block_body: str) -> str:
     )
 
     start = taskrc_text.find(BEGIN_MARKER)
-    end = taskrc_text.find(END_MARKER)
-    if start != -1 and end != -1 and start < end:
+    end = taskrc_text.find(END_MARKER, start) if start != -1 else -1
+    if end != -1:
         pre = taskrc_text[:start].rstrip() + "\n\n"
         post = taskrc_text[end + len(END_MARKER) :].lstrip()
         return pre + managed + "\n" + post
@@ -7,6 +7,9 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from taskdantic.models import Task
 
+TW_DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
+_UTC = timezone.utc
+
 
 def taskwarrior_to_datetime(tw_timestamp: str) -> datetime:
     """
@@ -21,7 +24,19 @@ def taskwarrior_to_datetime(tw_timestamp: str) -> datetime:
     Raises:
         ValueError: If timestamp format is invalid
     """
-    return datetime.strptime(tw_timestamp, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    ts = tw_timestamp
+    if len(ts) == 16 and ts[8] == "T" and ts[15] == "Z" and ts[:8].isdigit() and ts[9:15].isdigit():
+        # Fixed-width fast path: slice straight into the constructor instead of strptime.
+        return datetime(
+            int(ts[0:4]),
+            int(ts[4:6]),
+            int(ts[6:8]),
+            int(ts[9:11]),
+            int(ts[11:13]),
+            int(ts[13:15]),
+            tzinfo=_UTC,
+        )
+    return datetime.strptime(ts, TW_DATETIME_FORMAT).replace(tzinfo=_UTC)
 
 
 def datetime_to_taskwarrior(dt: datetime) -> str:
@@ -34,9 +49,12 @@ def datetime_to_taskwarrior(dt: datetime) -> str:
     Returns:
         Taskwarrior timestamp string (YYYYMMDDTHHmmssZ)
     """
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    tz = dt.tzinfo
+    # Naive and UTC datetimes already hold UTC wall-clock fields; only convert other zones.
+    if tz is not None and tz is not _UTC:
+        dt = dt.astimezone(_UTC)
+    # Fixed-width integer formatting avoids strftime's format-string parsing.
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
 
 
 def load_tasks(json_data: list[dict[str, Any]]) -> list[Task]:
@@ -57,7 +75,7 @@ def load_tasks(json_data: list[dict[str, Any]]) -> list[Task]:
     """
     from taskdantic.models import Task
 
-    return [Task.from_taskwarrior(task_data) for task_data in json_data]
+    return Task.from_taskwarrior_many(json_data)
 
 
 def export_tasks(tasks: list[Task], exclude_none: bool = True) -> list[dict[str, Any]]:
@@ -6,41 +6,38 @@ import pytest
 from taskdantic.enums import Priority, Status
 
 
-def test_status_values():
-    """Test Status enum has expected values."""
-    assert Status.PENDING.value == "pending"
-    assert Status.COMPLETED.value == "completed"
-    assert Status.DELETED.value == "deleted"
-    assert Status.RECURRING.value == "recurring"
-    assert Status.WAITING.value == "waiting"
-
-
-def test_priority_values():
-    """Test Priority enum has expected values."""
-    assert Priority.HIGH.value == "H"
-    assert Priority.MEDIUM.value == "M"
-    assert Priority.LOW.value == "L"
-
-
-def test_status_from_string():
-    """Test Status can be created from string."""
-    assert Status("pending") == Status.PENDING
-    assert Status("completed") == Status.COMPLETED
-
-
-def test_priority_from_string():
-    """Test Priority can be created from string."""
-    assert Priority("H") == Priority.HIGH
-    assert Priority("M") == Priority.MEDIUM
-
-
-def test_invalid_status():
-    """Test invalid status raises ValueError."""
-    with pytest.raises(ValueError):
-        Status("invalid")
-
-
-def test_invalid_priority():
-    """Test invalid priority raises ValueError."""
+@pytest.mark.parametrize(
+    ("value", "member"),
+    [
+        ("pending", Status.PENDING),
+        ("completed", Status.COMPLETED),
+        ("deleted", Status.DELETED),
+        ("recurring", Status.RECURRING),
+        ("waiting", Status.WAITING),
+    ],
+)
+def test_status_values(value: str, member: Status):
+    """Test Status enum values round-trip through string lookup."""
+    assert Status(value) is member
+    assert member.value == value
+
+
+@pytest.mark.parametrize(
+    ("value", "member"),
+    [
+        ("H", Priority.HIGH),
+        ("M", Priority.MEDIUM),
+        ("L", Priority.LOW),
+    ],
+)
+def test_priority_values(value: str, member: Priority):
+    """Test Priority enum values round-trip through string lookup."""
+    assert Priority(value) is member
+    assert member.value == value
+
+
+@pytest.mark.parametrize(("enum_cls", "value"), [(Status, "invalid"), (Priority, "X")])
+def test_invalid_enum_value(enum_cls: type, value: str):
+    """Test invalid enum values raise ValueError."""
     with pytest.raises(ValueError):
-        Priority("X")
+        enum_cls(value)
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
+from pydantic import ValidationError
 
 from taskdantic import Priority, Status, Task
 from taskdantic.models import Annotation
@@ -176,3 +177,37 @@ def test_export_import_preserves_datetime_precision():
     parsed = Task.from_taskwarrior(exported)
 
     assert parsed.due == original_time
+
+
+def test_from_taskwarrior_json_filters_computed_fields():
+    """Test parsing raw Taskwarrior JSON text, bytes or str."""
+    raw = (
+        '{"id": 7, "urgency": 3.1, "uuid": "12345678-1234-5678-1234-567812345678",'
+        ' "description": "From JSON", "status": "pending",'
+        ' "entry": "20240115T143022Z", "modified": "20240115T143022Z", "custom": "kept"}'
+    )
+
+    for payload in (raw, raw.encode("utf-8")):
+        task = Task.from_taskwarrior_json(payload)
+
+        assert task.description == "From JSON"
+        assert task.entry == datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc)
+        assert task.get_udas() == {"custom": "kept"}
+        assert not hasattr(task, "id")
+
+
+@pytest.mark.parametrize("raw", ["[1, 2]", '"x"', "null"])
+def test_from_taskwarrior_json_rejects_non_object(raw):
+    """Test that valid JSON of the wrong shape raises ValueError."""
+    with pytest.raises(ValueError, match="JSON object"):
+        Task.from_taskwarrior_json(raw)
+
+
+def test_try_from_taskwarrior_returns_error_instead_of_raising():
+    """Test that invalid rows come back as ValidationError instances."""
+    valid = Task.try_from_taskwarrior({"description": "Good", "urgency": 1.0})
+    invalid = Task.try_from_taskwarrior({"description": "", "status": "bogus"})
+
+    assert isinstance(valid, Task)
+    assert valid.description == "Good"
+    assert isinstance(invalid, ValidationError)
@@ -10,6 +10,9 @@ from taskdantic.enums import Status
 from taskdantic.models import Task
 from taskdantic.services import TaskService
 
+FIXED_UUID = UUID("12345678-1234-5678-1234-567812345678")
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
 
 def test_service_complete_updates_end_and_modified():
     service = TaskService()
@@ -56,13 +59,12 @@ def test_service_delete_sets_deleted_status_and_end():
 def test_service_dependency_operations():
     service = TaskService()
     task = Task(description="Main task")
-    dependency_uuid = UUID("12345678-1234-5678-1234-567812345678")
 
-    service.add_dependency(task, dependency_uuid)
-    assert dependency_uuid in task.depends
+    service.add_dependency(task, FIXED_UUID)
+    assert FIXED_UUID in task.depends
 
-    service.remove_dependency(task, dependency_uuid)
-    assert dependency_uuid not in task.depends
+    service.remove_dependency(task, FIXED_UUID)
+    assert FIXED_UUID not in task.depends
 
 
 def test_service_dependency_rejects_self():
@@ -71,3 +73,26 @@ def test_service_dependency_rejects_self():
 
     with pytest.raises(ValueError, match="depend on itself"):
         service.add_dependency(task, task)
+
+
+def test_service_annotate_uses_single_timestamp():
+    service = TaskService()
+    task = Task(description="Annotated task")
+
+    annotation = service.annotate(task, "Checked logs")
+
+    assert task.annotations == [annotation]
+    assert annotation.entry == task.modified
+
+
+def test_service_uses_injected_clock():
+    service = TaskService(clock=lambda: FROZEN_NOW)
+    task = Task(description="Frozen clock")
+
+    service.start(task)
+    assert task.start == FROZEN_NOW
+    assert task.modified == FROZEN_NOW
+
+    service.complete(task)
+    assert task.end == FROZEN_NOW
+    assert task.modified == FROZEN_NOW
@@ -5,10 +5,19 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
+from pydantic import TypeAdapter, ValidationError
 
 from taskdantic import Priority, Status, Task
 from taskdantic.models import Annotation
 
+FIXED_UUID = UUID("12345678-1234-5678-1234-567812345678")
+DUE_20240201 = datetime(2024, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+SCHEDULED_20240120 = datetime(2024, 1, 20, 9, 0, 0, tzinfo=timezone.utc)
+ENTRY_20240115 = datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc)
+NOTE_20240115 = datetime(2024, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+
+_ANNOTATION_LIST_ADAPTER = TypeAdapter(list[Annotation])
+
 
 def test_task_minimal_creation():
     """Test creating task with only required fields."""
@@ -21,6 +30,22 @@ def test_task_minimal_creation():
     assert isinstance(task.modified, datetime)
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"description": 123},
+        {"description": ""},
+        {"description": "Test task", "uuid": "not-a-uuid"},
+        {"description": "Test task", "priority": "X"},
+        {"description": "Test task", "status": "invalid"},
+    ],
+)
+def test_task_rejects_invalid(kwargs):
+    """Test that invalid core field values raise ValidationError."""
+    with pytest.raises(ValidationError):
+        Task(**kwargs)
+
+
 def test_task_with_all_common_fields():
     """Test creating task with common fields."""
     task = Task(
@@ -38,33 +63,28 @@ def test_task_with_all_common_fields():
 
 def test_task_with_dates():
     """Test creating task with various date fields."""
-    due = datetime(2024, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
-    scheduled = datetime(2024, 1, 20, 9, 0, 0, tzinfo=timezone.utc)
-
     task = Task(
         description="Test task",
-        due=due,
-        scheduled=scheduled,
+        due=DUE_20240201,
+        scheduled=SCHEDULED_20240120,
     )
 
-    assert task.due == due
-    assert task.scheduled == scheduled
+    assert task.due == DUE_20240201
+    assert task.scheduled == SCHEDULED_20240120
 
 
 def test_task_uuid_preservation():
     """Test that providing UUID preserves it."""
-    uuid = UUID("12345678-1234-5678-1234-567812345678")
-    task = Task(description="Test task", uuid=uuid)
+    task = Task(description="Test task", uuid=FIXED_UUID)
 
-    assert task.uuid == uuid
+    assert task.uuid == FIXED_UUID
 
 
 def test_task_with_dependencies():
     """Test task with dependencies."""
-    dep_uuid = UUID("12345678-1234-5678-1234-567812345678")
-    task = Task(description="Test task", depends=[dep_uuid])
+    task = Task(description="Test task", depends=[FIXED_UUID])
 
-    assert task.depends == [dep_uuid]
+    assert task.depends == [FIXED_UUID]
 
 
 def test_task_dependencies_from_string():
@@ -72,19 +92,23 @@ def test_task_dependencies_from_string():
     task = Task(description="Test task", depends="12345678-1234-5678-1234-567812345678")
 
     assert len(task.depends) == 1
-    assert task.depends[0] == UUID("12345678-1234-5678-1234-567812345678")
+    assert task.depends[0] == FIXED_UUID
 
 
 def test_task_with_annotations():
     """Test task with annotations."""
-    annotation = Annotation(
-        entry=datetime(2024, 1, 15, 14, 0, 0, tzinfo=timezone.utc),
-        description="Test note",
+    annotations = _ANNOTATION_LIST_ADAPTER.validate_python(
+        [
+            {"entry": NOTE_20240115, "description": "Test note"},
+            {"entry": NOTE_20240115, "description": "Second note"},
+        ]
     )
-    task = Task(description="Test task", annotations=[annotation])
+    task = Task(description="Test task", annotations=annotations)
 
-    assert len(task.annotations) == 1
+    assert len(task.annotations) == 2
+    assert all(isinstance(annotation, Annotation) for annotation in task.annotations)
     assert task.annotations[0].description == "Test note"
+    assert task.annotations[1].entry == NOTE_20240115
 
 
 def test_task_datetime_from_string():
@@ -95,8 +119,8 @@ def test_task_datetime_from_string():
         due="20240201T120000Z",
     )
 
-    assert task.entry == datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc)
-    assert task.due == datetime(2024, 2, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert task.entry == ENTRY_20240115
+    assert task.due == DUE_20240201
 
 
 def test_task_to_taskwarrior():
@@ -134,7 +158,7 @@ def test_task_export_datetime_format():
     """Test that datetimes are exported in Taskwarrior format."""
     task = Task(
         description="Test task",
-        entry=datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc),
+        entry=ENTRY_20240115,
     )
 
     data = task.to_taskwarrior()
@@ -143,9 +167,8 @@ def test_task_export_datetime_format():
 
 def test_task_export_depends_format():
     """Test that dependencies are exported as comma-separated string."""
-    uuid1 = UUID("12345678-1234-5678-1234-567812345678")
     uuid2 = UUID("87654321-4321-8765-4321-876543218765")
-    task = Task(description="Test task", depends=[uuid1, uuid2])
+    task = Task(description="Test task", depends=[FIXED_UUID, uuid2])
 
     data = task.to_taskwarrior()
     assert data["depends"] == "12345678-1234-5678-1234-567812345678,87654321-4321-8765-4321-876543218765"
@@ -6,6 +6,14 @@ from uuid import UUID
 
 from taskdantic import Annotation, Task
 
+FIRST_NOTE_ENTRY = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+SECOND_NOTE_ENTRY = datetime(2024, 1, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+
+# Declared out of order so the test can check UDA sorting.
+class TaggedAnnotation(Annotation):
+    source: str = "import"
+
 
 class PromptTask(Task):
     beta: str | None = None
@@ -18,11 +26,11 @@ def test_normalized_for_prompt_orders_udas_and_truncates_annotations() -> None:
         description="Normalize me",
         annotations=[
             Annotation(
-                entry=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+                entry=FIRST_NOTE_ENTRY,
                 description="first",
             ),
             Annotation(
-                entry=datetime(2024, 1, 2, 12, 0, 0, tzinfo=timezone.utc),
+                entry=SECOND_NOTE_ENTRY,
                 description="second",
             ),
         ],
@@ -38,3 +46,31 @@ def test_normalized_for_prompt_orders_udas_and_truncates_annotations() -> None:
     assert keys[-2:] == ["alpha", "beta"]
     assert len(normalized["annotations"]) == 1
     assert normalized["annotations"][0]["description"] == "first"
+
+
+def test_uda_field_order_is_precomputed_per_subclass() -> None:
+    assert Task.UDA_FIELD_ORDER == ()
+    assert PromptTask.UDA_FIELD_ORDER == ("alpha", "beta")
+
+
+def test_normalized_for_prompt_sorts_extra_udas_with_declared_udas() -> None:
+    task = PromptTask(description="Extras", beta="B", aardvark="X", gamma="G")
+
+    normalized = task.normalized_for_prompt()
+
+    assert list(normalized.keys())[-3:] == ["aardvark", "beta", "gamma"]
+
+
+def test_normalized_for_prompt_annotations_match_export() -> None:
+    task = PromptTask(
+        description="Annotated",
+        annotations=[
+            TaggedAnnotation(entry=FIRST_NOTE_ENTRY, description="first"),
+            Annotation(entry=SECOND_NOTE_ENTRY, description="second"),
+        ],
+    )
+
+    exported = task.to_taskwarrior()["annotations"]
+
+    for limit in (0, 1, 2):
+        assert task.normalized_for_prompt(max_annotations=limit)["annotations"] == exported[:limit]
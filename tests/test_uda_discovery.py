@@ -1,8 +1,17 @@
 # tests/test_uda_discovery.py
 from __future__ import annotations
 
+import gc
+import os
+import sys
+import weakref
+from pathlib import Path
+
+from pydantic import create_model
+
 from taskdantic import Task
-from taskdantic.uda_discovery import discover_task_models
+from taskdantic.models import _TASK_SUBCLASSES
+from taskdantic.uda_discovery import discover_task_models, import_task_modules_from_dir
 
 
 class DiscoveryBaseTask(Task):
@@ -19,3 +28,37 @@ def test_discover_task_models_finds_subclasses() -> None:
     assert DiscoveryBaseTask in models
     assert DiscoveryChildTask in models
     assert Task not in models
+
+
+def test_discover_task_models_preserves_definition_order() -> None:
+    models = discover_task_models(allowed_modules={__name__})
+
+    assert models.index(DiscoveryBaseTask) < models.index(DiscoveryChildTask)
+
+
+def test_collected_subclasses_leave_the_registry() -> None:
+    throwaway = [weakref.ref(create_model(f"ThrowawayTask{i}", __base__=Task)) for i in range(20)]
+    gc.collect()
+
+    assert all(ref() is None for ref in throwaway)
+    # The weakref callbacks removed the entries; no dead references linger.
+    assert all(ref() is not None for ref in _TASK_SUBCLASSES)
+
+
+def test_import_task_modules_skips_unchanged_files(tmp_path: Path) -> None:
+    tasks_file = tmp_path / "tasks.py"
+    tasks_file.write_text("from taskdantic import Task\n\n\nclass CachedTask(Task):\n    pass\n", encoding="utf-8")
+
+    (mod_name,) = import_task_modules_from_dir(tmp_path)
+    first = sys.modules[mod_name]
+    assert import_task_modules_from_dir(tmp_path) == {mod_name}
+    assert sys.modules[mod_name] is first
+
+    # Same size and mtime, as after a quick edit on a coarse-timestamp filesystem.
+    stat = tasks_file.stat()
+    tasks_file.write_text("from taskdantic import Task\n\n\nclass EditedTask(Task):\n    pass\n", encoding="utf-8")
+    os.utime(tasks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    import_task_modules_from_dir(tmp_path)
+
+    assert sys.modules[mod_name] is not first
+    assert hasattr(sys.modules[mod_name], "EditedTask")
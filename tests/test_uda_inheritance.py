@@ -379,3 +379,17 @@ def test_complex_timedelta():
 
     imported = AgileTask.from_taskwarrior(exported)
     assert imported.estimate == timedelta(hours=10, minutes=45, seconds=30)
+
+
+@pytest.mark.parametrize("value", ["PT30M15", "PT5X", "PT1M2H"])
+def test_malformed_timedelta_rejected(value):
+    """Test that malformed ISO 8601 durations are rejected rather than truncated."""
+    with pytest.raises(Exception):  # ValidationError
+        AgileTask(description="Test", estimate=value)
+
+
+@pytest.mark.parametrize("value", ["PT1H30M ", " PT1H30M", "\tPT1H30M\n"])
+def test_timedelta_surrounding_whitespace_ignored(value):
+    """Test that whitespace around an ISO 8601 duration is stripped before parsing."""
+    task = AgileTask(description="Test", estimate=value)
+    assert task.estimate == timedelta(hours=1, minutes=30)
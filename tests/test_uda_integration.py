@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import UUID
 
 import pytest
-from pydantic import Field, field_validator
+from pydantic import field_validator
 
 from taskdantic import Priority, Status, Task, TWDatetime, TWDuration, UUIDList
 
@@ -30,7 +32,7 @@ class AgileTask(Task):
 class BugTask(Task):
     """Bug tracking task."""
 
-    severity: str = Field(default="medium", pattern="^(low|medium|high|critical)$")
+    severity: Literal["low", "medium", "high", "critical"] = "medium"
     reported_by: str | None = None
     fixed_in: str | None = None
 
@@ -38,7 +40,7 @@ class BugTask(Task):
 class DevOpsTask(Task):
     """DevOps deployment task."""
 
-    environment: str | None = Field(default=None, pattern="^(dev|staging|prod)$")
+    environment: Literal["dev", "staging", "prod"] | None = None
     deployment_time: TWDatetime | None = None
     rollback_safe: bool = True
 
@@ -141,9 +143,10 @@ def test_devops_deployment_workflow():
         rollback_safe=False,
     )
 
+    deployed_at = datetime.now(timezone.utc)
     for task in [dev_deploy, staging_deploy, prod_deploy]:
         task.status = Status.COMPLETED
-        task.deployment_time = datetime.now(timezone.utc)
+        task.deployment_time = deployed_at
 
     assert dev_deploy.environment == "dev"
     assert staging_deploy.environment == "staging"
@@ -258,13 +261,15 @@ def test_task_status_transitions_with_udas():
         estimate=timedelta(hours=6),
     )
 
+    now = datetime.now(timezone.utc)
+
     task.status = Status.PENDING
-    task.start = datetime.now(timezone.utc)
+    task.start = now
 
-    task.reviewed = datetime.now(timezone.utc)
+    task.reviewed = now
 
     task.status = Status.COMPLETED
-    task.end = datetime.now(timezone.utc)
+    task.end = now
 
     assert task.status == Status.COMPLETED
     assert task.sprint == "Sprint 25"
@@ -280,10 +285,8 @@ def test_batch_operations_with_udas():
         for i in range(10)
     ]
 
-    by_sprint: dict[str, list[AgileTask]] = {}
+    by_sprint: defaultdict[str, list[AgileTask]] = defaultdict(list)
     for task in tasks:
-        if task.sprint not in by_sprint:
-            by_sprint[task.sprint] = []
         by_sprint[task.sprint].append(task)
 
     assert len(by_sprint) >= 3
@@ -354,3 +357,60 @@ def test_inheritance_with_validators():
 
     with pytest.raises(Exception):  # ValidationError
         BaseTaskWithValidation(description="Test", estimate=timedelta(days=60))
+
+
+def test_from_taskwarrior_many_uses_subclass():
+    """Test batch import of raw rows and JSON arrays into a Task subclass."""
+    rows = [AgileTask(description=f"Task {i}", sprint="Sprint 30", points=i).to_taskwarrior() for i in range(3)]
+    rows[0]["urgency"] = 4.2
+
+    from_rows = AgileTask.from_taskwarrior_many(rows)
+    from_json_text = AgileTask.from_taskwarrior_json_many(json.dumps(rows))
+
+    for imported in (from_rows, from_json_text):
+        assert [t.description for t in imported] == ["Task 0", "Task 1", "Task 2"]
+        assert all(isinstance(t, AgileTask) for t in imported)
+        assert [t.points for t in imported] == [0, 1, 2]
+        assert not hasattr(imported[0], "urgency")
+
+
+def test_from_taskwarrior_json_many_rejects_single_object():
+    """Test that one task object is not mistaken for an export array."""
+    raw = json.dumps(AgileTask(description="Lone task").to_taskwarrior())
+
+    with pytest.raises(ValueError, match="JSON array"):
+        AgileTask.from_taskwarrior_json_many(raw)
+
+
+@pytest.mark.parametrize(
+    ("raw", "index"),
+    [("[1]", 0), ("[null]", 0), ('[{"description": "ok"}, "x"]', 1)],
+)
+def test_from_taskwarrior_json_many_rejects_non_object_rows(raw, index):
+    """Test that array elements that are not task objects are reported by index."""
+    with pytest.raises(ValueError, match=f"index {index}"):
+        AgileTask.from_taskwarrior_json_many(raw)
+
+
+def test_literal_udas_reject_unknown_values():
+    """Test that Literal-typed UDAs reject values outside their set."""
+    with pytest.raises(Exception):  # ValidationError
+        BugTask(description="Bug", severity="urgent")
+
+    with pytest.raises(Exception):  # ValidationError
+        DevOpsTask(description="Deploy", environment="qa")
+
+
+def test_to_taskwarrior_json_matches_dict_export():
+    """Test JSON export text decodes to the to_taskwarrior() dict."""
+    task = AgileTask(
+        description="JSON export",
+        sprint="27",
+        estimate=timedelta(hours=2),
+        reviewed=datetime(2024, 1, 20, 10, 0, 0, tzinfo=timezone.utc),
+    )
+
+    raw = task.to_taskwarrior_json()
+
+    assert json.loads(raw) == task.to_taskwarrior()
+    assert AgileTask.from_taskwarrior_json(raw).sprint == "Sprint 27"
@@ -1,6 +1,8 @@
 # tests/test_uda_taskrc.py
 from __future__ import annotations
 
+import pytest
+
 from taskdantic.uda_taskrc import BEGIN_MARKER, END_MARKER, parse_existing_uda_names, upsert_uda_block
 
 
@@ -20,6 +22,17 @@ def test_parse_existing_uda_names() -> None:
     assert names == {"alpha", "beta", "gamma"}
 
 
+@pytest.mark.parametrize(
+    "separator",
+    ["\n", "\r\n", "\r", "\n\f", "\v", "\u2028"],
+    ids=["lf", "crlf", "cr", "formfeed-indent", "vtab", "line-separator"],
+)
+def test_parse_existing_uda_names_line_endings(separator: str) -> None:
+    taskrc_text = separator.join(["# uda.commented.type=string", "uda.alpha.type=string", "  uda.beta.type=numeric"])
+
+    assert parse_existing_uda_names(taskrc_text) == {"alpha", "beta"}
+
+
 def test_upsert_uda_block_inserts_when_missing() -> None:
     original = "include ~/.taskrc\n"
     block_body = "uda.alpha.type=string\n"
@@ -49,3 +62,13 @@ def test_upsert_uda_block_replaces_existing_block() -> None:
     assert "uda.new.type=numeric" in updated
     assert updated.splitlines()[0] == "tag.color=blue"
     assert updated.strip().endswith("report.list.columns=id,description")
+
+
+def test_upsert_uda_block_ignores_stray_end_marker_before_block() -> None:
+    original = f"{END_MARKER}\ntag.color=blue\n\n{BEGIN_MARKER}\nuda.old.type=string\n{END_MARKER}\n"
+
+    updated = upsert_uda_block(original, "uda.new.type=numeric\n")
+
+    assert updated.count(BEGIN_MARKER) == 1
+    assert "uda.old.type=string" not in updated
+    assert "uda.new.type=numeric" in updated
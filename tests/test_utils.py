@@ -1,7 +1,7 @@
 # tests/test_utils.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -15,11 +15,21 @@ def test_taskwarrior_to_datetime():
     assert result == expected
 
 
-def test_datetime_to_taskwarrior():
-    """Test serializing datetime to Taskwarrior format."""
-    dt = datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc)
-    result = datetime_to_taskwarrior(dt)
-    assert result == "20240115T143022Z"
+@pytest.mark.parametrize(
+    ("dt", "expected"),
+    [
+        pytest.param(datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone.utc), "20240115T143022Z", id="utc"),
+        pytest.param(datetime(2024, 1, 15, 14, 30, 22), "20240115T143022Z", id="naive-as-utc"),
+        pytest.param(
+            datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone(timedelta(hours=5))),
+            "20240115T093022Z",
+            id="offset-converted-to-utc",
+        ),
+    ],
+)
+def test_datetime_to_taskwarrior(dt, expected):
+    """Test serializing datetimes to Taskwarrior format in UTC."""
+    assert datetime_to_taskwarrior(dt) == expected
 
 
 def test_datetime_roundtrip():
@@ -30,17 +40,8 @@ def test_datetime_roundtrip():
     assert result == original
 
 
-def test_datetime_to_taskwarrior_naive():
-    """Test that naive datetimes are treated as UTC."""
-    dt = datetime(2024, 1, 15, 14, 30, 22)
-    result = datetime_to_taskwarrior(dt)
-    assert result == "20240115T143022Z"
-
-
-def test_datetime_to_taskwarrior_timezone_conversion():
-    """Test that non-UTC timezones are converted to UTC."""
-    from datetime import timedelta
-
-    dt = datetime(2024, 1, 15, 14, 30, 22, tzinfo=timezone(timedelta(hours=5)))
-    result = datetime_to_taskwarrior(dt)
-    assert result == "20240115T093022Z"
+@pytest.mark.parametrize("value", ["20241315T143022Z", "2024011xT143022Z", "20240115 143022Z", "not a timestamp"])
+def test_taskwarrior_to_datetime_invalid(value):
+    """Test that malformed timestamps raise ValueError."""
+    with pytest.raises(ValueError):
+        taskwarrior_to_datetime(value)